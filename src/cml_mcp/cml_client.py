@@ -162,6 +162,11 @@ class CMLClient(object):
     async def get(self, endpoint: str, params: dict | None = None, is_binary: bool = False) -> Any:
         """
         Make a GET request to the CML API.
+
+        By default the response body is decoded as JSON. With ``is_binary=True`` the
+        undecoded body (``bytes``) is returned instead: use it for binary payloads
+        (e.g. PCAP files, lab topology downloads) and for large JSON bodies that are
+        validated directly with ``TypeAdapter.validate_json``.
         """
         await self.check_authentication()
         url = f"{self.api_base}{endpoint}"
@@ -32,7 +32,7 @@ from typing import Annotated, Literal
 import httpx
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
-from pydantic import BaseModel
+from pydantic import Field, TypeAdapter
 
 from cml_mcp.cml.simple_webserver.schemas.annotations import (
     CoordinateFloat,
@@ -47,16 +47,18 @@ from cml_mcp.cml.simple_webserver.schemas.annotations import (
 )
 from cml_mcp.cml.simple_webserver.schemas.common import AnnotationColor, UUID4Type
 from cml_mcp.tools.dependencies import elicit_confirmation, get_cml_client_dep
-from cml_mcp.tools.model_helpers import build_payload, field_from
+from cml_mcp.tools.model_helpers import build_payload, field_from, validate_and_dump
 
 logger = logging.getLogger("cml-mcp.tools.annotations")
 
-_ANNOTATION_RESPONSE_TYPES: dict[str, type[BaseModel]] = {
-    "text": TextAnnotationResponse,
-    "rectangle": RectangleAnnotationResponse,
-    "ellipse": EllipseAnnotationResponse,
-    "line": LineAnnotationResponse,
-}
+# Tagged union keyed on the annotation "type": pydantic-core dispatches each item
+# straight to its response model, so the whole list validates in a single pass.
+# An unknown type fails with an error that names the offending tag.
+_AnnotationResponse = Annotated[
+    TextAnnotationResponse | RectangleAnnotationResponse | EllipseAnnotationResponse | LineAnnotationResponse,
+    Field(discriminator="type"),
+]
+_annotations_adapter = TypeAdapter(list[_AnnotationResponse])
 
 
 def register_tools(mcp):
@@ -83,15 +85,8 @@ def register_tools(mcp):
         client = get_cml_client_dep()
         try:
             resp = await client.get(f"/labs/{lab_id}/annotations")
-            ann_list = []
-            for annotation in resp:
-                ann_type = annotation.get("type")
-                model = _ANNOTATION_RESPONSE_TYPES.get(ann_type)
-                if model is None:
-                    raise ToolError(f"Unknown annotation type: {ann_type!r}. " f"Expected one of {sorted(_ANNOTATION_RESPONSE_TYPES)}.")
-                # See model_helpers.py / DEVELOPMENT.md: dump after construction to bypass FastMCP double marshalling.
-                ann_list.append(model(**annotation).model_dump(exclude_unset=True))
-            return ann_list
+            # See model_helpers.py / DEVELOPMENT.md: dump after construction to bypass FastMCP double marshalling.
+            return validate_and_dump(_annotations_adapter, resp)
         except httpx.HTTPStatusError as e:
             raise ToolError(f"HTTP error {e.response.status_code}: {e.response.text}")
         except Exception as e:
@@ -30,16 +30,19 @@ import logging
 
 import httpx
 from fastmcp.exceptions import ToolError
+from pydantic import TypeAdapter
 
 from cml_mcp.cml.simple_webserver.schemas.common import MACAddress, UUID4Type
 from cml_mcp.cml.simple_webserver.schemas.interfaces import InterfaceSlot
 from cml_mcp.cml_client import CMLClient
 from cml_mcp.tools.dependencies import get_cml_client_dep
-from cml_mcp.tools.model_helpers import build_payload
+from cml_mcp.tools.model_helpers import build_payload, validate_and_dump
 from cml_mcp.types import SimplifiedInterfaceResponse
 
 logger = logging.getLogger("cml-mcp.tools.interfaces")
 
+_interfaces_adapter = TypeAdapter(list[SimplifiedInterfaceResponse])
+
 
 async def add_interface(lab_id: UUID4Type, payload: dict, client: CMLClient) -> list[SimplifiedInterfaceResponse]:
     """
@@ -56,9 +59,9 @@ async def add_interface(lab_id: UUID4Type, payload: dict, client: CMLClient) ->
     resp = await client.post(f"/labs/{lab_id}/interfaces", data=payload)
     # See DEVELOPMENT.md "Object-typed return values": dump after construction so FastMCP doesn't double-marshal.
     if isinstance(resp, dict):
-        return [SimplifiedInterfaceResponse(**resp).model_dump(exclude_unset=True)]
+        resp = [resp]
 
-    return [SimplifiedInterfaceResponse(**item).model_dump(exclude_unset=True) for item in resp]
+    return validate_and_dump(_interfaces_adapter, resp)
 
 
 def register_tools(mcp):
@@ -129,7 +132,7 @@ def register_tools(mcp):
         try:
             resp = await client.get(f"/labs/{lab_id}/nodes/{node_id}/interfaces", params={"data": True, "operational": False})
             # See DEVELOPMENT.md "Object-typed return values": dump after construction so FastMCP doesn't double-marshal.
-            return [SimplifiedInterfaceResponse(**iface).model_dump(exclude_unset=True) for iface in resp]
+            return validate_and_dump(_interfaces_adapter, resp)
         except httpx.HTTPStatusError as e:
             raise ToolError(f"HTTP error {e.response.status_code}: {e.response.text}")
         except Exception as e:
@@ -31,14 +31,17 @@ from typing import Annotated
 
 import httpx
 from fastmcp.exceptions import ToolError
+from pydantic import TypeAdapter
 
 from cml_mcp.cml.simple_webserver.schemas.common import UUID4Type
 from cml_mcp.cml.simple_webserver.schemas.links import LinkConditionConfiguration, LinkCreate, LinkResponse
 from cml_mcp.tools.dependencies import get_cml_client_dep
-from cml_mcp.tools.model_helpers import build_payload, field_from
+from cml_mcp.tools.model_helpers import build_payload, field_from, validate_and_dump
 
 logger = logging.getLogger("cml-mcp.tools.links")
 
+_links_adapter = TypeAdapter(list[LinkResponse])
+
 
 def register_tools(mcp):
     """Register all link-related tools with the FastMCP server."""
@@ -100,7 +103,8 @@ def register_tools(mcp):
         client = get_cml_client_dep()
         try:
             resp = await client.get(f"/labs/{lab_id}/links", params={"data": True})
-            return [LinkResponse(**link).model_dump(exclude_unset=True) for link in resp]
+            # See DEVELOPMENT.md "Object-typed return values": dump after construction so FastMCP doesn't double-marshal.
+            return validate_and_dump(_links_adapter, resp)
         except httpx.HTTPStatusError as e:
             raise ToolError(f"HTTP error {e.response.status_code}: {e.response.text}")
         except Exception as e:
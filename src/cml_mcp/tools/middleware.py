@@ -54,6 +54,21 @@ _url_adapter = TypeAdapter(AnyHttpUrl)
 acl_data: dict[str, Any] = {}
 
 
+def _tool_name_set(tools: list | None, username: str, list_name: str) -> frozenset[str] | None:
+    """
+    Convert an ACL tool list to a frozenset of tool names.
+
+    Non-string entries (e.g. a bare ``123`` or ``yes`` in the YAML) can never match a
+    tool name, so they are dropped with a warning while the rest of the list stays enforced.
+    """
+    if tools is None:
+        return None
+    invalid = [t for t in tools if not isinstance(t, str)]
+    if invalid:
+        logger.warning("Ignoring non-string entries %r in %s for user %s in ACLs", invalid, list_name, username)
+    return frozenset(t for t in tools if isinstance(t, str))
+
+
 def _validate_acl_data(raw_acl_data: dict | None) -> dict | None:
     """
     Validate and normalize ACL configuration data.
@@ -97,9 +112,11 @@ def _validate_acl_data(raw_acl_data: dict | None) -> dict | None:
             logger.warning("Invalid disabled_tools for user %s in ACLs; skipping user", username)
             continue
 
+        # Store the tool lists as frozensets: check_tool_enabled() runs for every tool on
+        # each tools/list and tools/call, so membership tests should not scan a list.
         validated_users[username] = {
-            "enabled_tools": enabled_tools,
-            "disabled_tools": disabled_tools,
+            "enabled_tools": _tool_name_set(enabled_tools, username, "enabled_tools"),
+            "disabled_tools": _tool_name_set(disabled_tools, username, "disabled_tools"),
         }
 
     return {
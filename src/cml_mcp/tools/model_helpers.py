@@ -36,9 +36,9 @@ while the MCP tool layer remains forgiving.
 
 import json
 import logging
-from typing import TypeVar
+from typing import Any, TypeVar
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from pydantic.fields import FieldInfo
 
 logger = logging.getLogger("cml-mcp.tools.model_helpers")
@@ -124,6 +124,24 @@ def build_payload(**kwargs: object) -> dict:
     return {k: v for k, v in kwargs.items() if v is not None}
 
 
+def validate_and_dump(adapter: TypeAdapter, data: Any) -> Any:
+    """Validate ``data`` with a module-level ``TypeAdapter`` and dump it back to plain Python.
+
+    List-returning tools create one adapter per response type at import time and
+    reuse it on every call, so the whole response is validated and dumped in a
+    single pydantic-core pass instead of constructing and dumping each item in a
+    Python loop.  The dump uses ``exclude_unset=True``, matching the per-model
+    ``model_dump`` convention (see DEVELOPMENT.md "Object-typed return values").
+
+    Raw ``bytes`` (a response fetched with ``is_binary=True``) are parsed with
+    ``validate_json`` so pydantic-core decodes the JSON itself, skipping the
+    intermediate ``json.loads`` Python objects for large responses.
+    """
+    if isinstance(data, bytes):
+        return adapter.dump_python(adapter.validate_json(data), exclude_unset=True)
+    return adapter.dump_python(adapter.validate_python(data), exclude_unset=True)
+
+
 _FIELD_FROM_EXCLUDE = frozenset({"default", "default_factory", "annotation"})
 
 
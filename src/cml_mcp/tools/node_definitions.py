@@ -30,15 +30,19 @@ import logging
 
 import httpx
 from fastmcp.exceptions import ToolError
+from pydantic import TypeAdapter
 
 from cml_mcp.cml.simple_webserver.schemas.common import DefinitionID
 from cml_mcp.cml.simple_webserver.schemas.node_definitions import NodeDefinition
 from cml_mcp.cml_client import CMLClient
 from cml_mcp.tools.dependencies import get_cml_client_dep
+from cml_mcp.tools.model_helpers import validate_and_dump
 from cml_mcp.types import SuperSimplifiedNodeDefinitionResponse
 
 logger = logging.getLogger("cml-mcp.tools.node_definitions")
 
+_node_defs_adapter = TypeAdapter(list[SuperSimplifiedNodeDefinitionResponse])
+
 
 async def get_node_def_details(definition_id: DefinitionID, client: CMLClient) -> NodeDefinition:
     """
@@ -79,7 +83,8 @@ def register_tools(mcp):
         client = get_cml_client_dep()
         try:
             node_definitions = await client.get("/simplified_node_definitions")
-            return [SuperSimplifiedNodeDefinitionResponse(**nd).model_dump(exclude_unset=True) for nd in node_definitions]
+            # See DEVELOPMENT.md "Object-typed return values": dump after construction so FastMCP doesn't double-marshal.
+            return validate_and_dump(_node_defs_adapter, node_definitions)
         except httpx.HTTPStatusError as e:
             raise ToolError(f"HTTP error {e.response.status_code}: {e.response.text}")
         except Exception as e:
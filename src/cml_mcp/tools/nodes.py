@@ -33,15 +33,18 @@ from typing import Annotated
 import httpx
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from pydantic import TypeAdapter
 
 from cml_mcp.cml.simple_webserver.schemas.common import Coordinate, DefinitionID, TagArray, UUID4Type
 from cml_mcp.cml.simple_webserver.schemas.nodes import CpuLimit, Cpus, DiskSpace, Node, NodeConfigurationContent, NodeCreate, Ram
 from cml_mcp.cml_client import CMLClient
 from cml_mcp.tools.dependencies import elicit_confirmation, get_cml_client_dep
-from cml_mcp.tools.model_helpers import build_payload, field_from
+from cml_mcp.tools.model_helpers import build_payload, field_from, validate_and_dump
 
 logger = logging.getLogger("cml-mcp.tools.nodes")
 
+_nodes_adapter = TypeAdapter(list[Node])
+
 
 async def stop_node(lab_id: UUID4Type, node_id: UUID4Type, client: CMLClient) -> None:
     """
@@ -90,8 +93,7 @@ def register_tools(mcp):  # noqa: C901
         client = get_cml_client_dep()
         try:
             resp = await client.get(f"/labs/{lab_id}/nodes", params={"data": True, "operational": True, "exclude_configurations": True})
-            rnodes = []
-            for node in list(resp):
+            for node in resp:
                 # XXX: Fixup known issues with bad data coming from
                 # certain node types.
                 if node.get("operational") is not None:
@@ -101,8 +103,8 @@ def register_tools(mcp):  # noqa: C901
                         node["operational"]["image_definition"] = None
                     if node["operational"].get("serial_consoles") is None:
                         node["operational"]["serial_consoles"] = []
-                rnodes.append(Node(**node).model_dump(exclude_unset=True))
-            return rnodes
+            # See DEVELOPMENT.md "Object-typed return values": dump after construction so FastMCP doesn't double-marshal.
+            return validate_and_dump(_nodes_adapter, resp)
         except httpx.HTTPStatusError as e:
             raise ToolError(f"HTTP error {e.response.status_code}: {e.response.text}")
         except Exception as e:
@@ -32,15 +32,18 @@ from typing import Annotated, Literal
 
 import httpx
 from fastmcp.exceptions import ToolError
+from pydantic import TypeAdapter
 
 from cml_mcp.cml.simple_webserver.schemas.common import UUID4Type
 from cml_mcp.cml.simple_webserver.schemas.pcap import PCAPItem, PCAPStart, PCAPStatusResponse
 from cml_mcp.cml_client import CMLClient
 from cml_mcp.tools.dependencies import get_cml_client_dep
-from cml_mcp.tools.model_helpers import build_payload, field_from
+from cml_mcp.tools.model_helpers import build_payload, field_from, validate_and_dump
 
 logger = logging.getLogger("cml-mcp.tools.pcap")
 
+_packets_adapter = TypeAdapter(list[PCAPItem])
+
 
 async def get_capture_key(lab_id: UUID4Type, link_id: UUID4Type, client: CMLClient) -> str:
     """
@@ -164,8 +167,11 @@ def register_tools(mcp):
         client = get_cml_client_dep()
         try:
             key = await get_capture_key(lab_id, link_id, client)
-            packets = await client.get(f"/pcap/{key}/packets")
-            return [PCAPItem(**packet).model_dump(exclude_unset=True) for packet in packets]
+            # Fetch the undecoded JSON body (is_binary=True): a capture can hold up to a million
+            # packets, so let pydantic-core parse and validate it in one go rather than via resp.json().
+            packets = await client.get(f"/pcap/{key}/packets", is_binary=True)
+            # See DEVELOPMENT.md "Object-typed return values": dump after construction so FastMCP doesn't double-marshal.
+            return validate_and_dump(_packets_adapter, packets)
         except httpx.HTTPStatusError as e:
             raise ToolError(f"HTTP error {e.response.status_code}: {e.response.text}")
         except Exception as e:
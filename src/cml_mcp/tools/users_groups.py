@@ -34,15 +34,19 @@ from fastmcp import Context
 from fastmcp.exceptions import ToolError
 from mcp.shared.exceptions import McpError
 from mcp.types import INVALID_REQUEST, METHOD_NOT_FOUND
+from pydantic import TypeAdapter
 
 from cml_mcp.cml.simple_webserver.schemas.common import GroupName, UserFullName, UserName, UUID4Type
 from cml_mcp.cml.simple_webserver.schemas.groups import GroupCreate, GroupResponse
 from cml_mcp.cml.simple_webserver.schemas.users import UserCreate, UserResponse
 from cml_mcp.tools.dependencies import get_cml_client_dep
-from cml_mcp.tools.model_helpers import build_payload, field_from
+from cml_mcp.tools.model_helpers import build_payload, field_from, validate_and_dump
 
 logger = logging.getLogger("cml-mcp.tools.users_groups")
 
+_users_adapter = TypeAdapter(list[UserResponse])
+_groups_adapter = TypeAdapter(list[GroupResponse])
+
 
 def register_tools(mcp):  # noqa: C901
     """Register all user and group management tools with the FastMCP server."""
@@ -67,7 +71,8 @@ def register_tools(mcp):  # noqa: C901
         client = get_cml_client_dep()
         try:
             users = await client.get("/users")
-            return [UserResponse(**user).model_dump(exclude_unset=True) for user in users]
+            # See DEVELOPMENT.md "Object-typed return values": dump after construction so FastMCP doesn't double-marshal.
+            return validate_and_dump(_users_adapter, users)
         except httpx.HTTPStatusError as e:
             raise ToolError(f"HTTP error {e.response.status_code}: {e.response.text}")
         except Exception as e:
@@ -202,7 +207,8 @@ def register_tools(mcp):  # noqa: C901
         client = get_cml_client_dep()
         try:
             groups = await client.get("/groups")
-            return [GroupResponse(**group).model_dump(exclude_unset=True) for group in groups]
+            # See DEVELOPMENT.md "Object-typed return values": dump after construction so FastMCP doesn't double-marshal.
+            return validate_and_dump(_groups_adapter, groups)
         except httpx.HTTPStatusError as e:
             raise ToolError(f"HTTP error {e.response.status_code}: {e.response.text}")
         except Exception as e:
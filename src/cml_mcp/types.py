@@ -22,39 +22,38 @@
 # OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF
 # SUCH DAMAGE.
 
-from typing import Literal
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field
 
 from cml_mcp.cml.simple_webserver.schemas.common import DefinitionID, LinuxInterfaceName, UUID4Type
 from cml_mcp.cml.simple_webserver.schemas.node_definitions import DeviceNature
 
+# Shared 0-4 bound for the serial port fields of SimplifiedInterfaces.
+SerialPort = Annotated[int, Field(ge=0, le=4)]
 
-class SimplifiedGeneral(BaseModel, extra="ignore"):
+
+class SimplifiedGeneral(BaseModel, extra="ignore", frozen=True):
     nature: DeviceNature = Field(...)
     description: str | None = Field(default=None)
     read_only: bool = Field(default=False)
 
 
-class SimplifiedInterfaces(BaseModel, extra="ignore"):
+class SimplifiedInterfaces(BaseModel, extra="ignore", frozen=True):
     """
     Interface configurations.
     """
 
-    serial_ports: int = Field(
+    serial_ports: SerialPort = Field(
         ...,
         description="""
             Number of serial ports (console, aux, ...). Maximum value is 4 for KVM
             and 2 for Docker/IOL nodes.
         """,
-        ge=0,
-        le=4,
     )
-    default_console: int | None = Field(
+    default_console: SerialPort | None = Field(
         default=None,
         description="Default serial port for console connections.",
-        ge=0,
-        le=4,
     )
     has_loopback_zero: bool = Field(..., description="Has `loopback0` interface (used with ANK).")
     min_count: int = Field(
@@ -72,11 +71,11 @@ class SimplifiedInterfaces(BaseModel, extra="ignore"):
     )
 
 
-class SimplifiedDevice(BaseModel, extra="ignore"):
+class SimplifiedDevice(BaseModel, extra="ignore", frozen=True):
     interfaces: SimplifiedInterfaces = Field(...)
 
 
-class SuperSimplifiedNodeDefinitionResponse(BaseModel, extra="ignore"):
+class SuperSimplifiedNodeDefinitionResponse(BaseModel, extra="ignore", frozen=True):
     id: DefinitionID = Field(
         ...,
         description="""
@@ -89,14 +88,14 @@ class SuperSimplifiedNodeDefinitionResponse(BaseModel, extra="ignore"):
     image_definitions: list[DefinitionID] = Field(default_factory=list)
 
 
-class SimplifiedInterfaceBase(BaseModel, extra="ignore"):
+class SimplifiedInterfaceBase(BaseModel, extra="ignore", frozen=True):
     """Interface object."""
 
-    label: str = Field(default=None)
-    is_connected: bool = Field(default=None, description="Whether this interface is connected (in-use).")
+    label: str | None = Field(default=None)
+    is_connected: bool | None = Field(default=None, description="Whether this interface is connected (in-use).")
 
 
-class SimplifiedInterfaceResponse(SimplifiedInterfaceBase, extra="ignore"):
+class SimplifiedInterfaceResponse(SimplifiedInterfaceBase, extra="ignore", frozen=True):
     """The response body is a JSON interface object."""
 
     id: UUID4Type = Field(..., description="ID of the interface.")
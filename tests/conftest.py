@@ -157,7 +157,11 @@ class MockCMLClient:
         # Handle pcap endpoints
         if "/pcap/" in endpoint and "/packets" in endpoint:
             # Get captured packet overview
-            return self._load_mock_file("get_captured_packet_overview.json") or []
+            # Returns the raw JSON body when is_binary=True, matching real CML API behavior
+            data = self._load_mock_file("get_captured_packet_overview.json") or []
+            if is_binary:
+                return json.dumps(data).encode("utf-8")
+            return data
         elif "/pcap/" in endpoint:
             # Get full packet capture data (binary)
             # Return empty bytes for now
@@ -0,0 +1,69 @@
+# Copyright (c) 2025-2026  Cisco Systems, Inc.
+# All rights reserved.
+
+"""Unit tests for ACL validation and enforcement in cml_mcp.tools.middleware (mock / no-live runs)."""
+
+from __future__ import annotations
+
+import pytest
+
+from cml_mcp.tools import middleware
+from cml_mcp.tools.middleware import CustomHttpRequestMiddleware, _validate_acl_data
+
+pytestmark = pytest.mark.mock_only
+
+
+class _MockClient:
+    def __init__(self, username: str) -> None:
+        self.username = username
+
+
+@pytest.fixture()
+def acl(monkeypatch):
+    """Install validated ACL data for the duration of a test."""
+
+    def _install(raw: dict) -> dict:
+        validated = _validate_acl_data(raw)
+        monkeypatch.setattr(middleware, "acl_data", validated)
+        return validated
+
+    return _install
+
+
+def test_tool_lists_become_frozensets():
+    out = _validate_acl_data({"users": {"alice": {"enabled_tools": ["get_cml_labs"], "disabled_tools": None}}})
+    assert out["users"]["alice"] == {"enabled_tools": frozenset({"get_cml_labs"}), "disabled_tools": None}
+
+
+def test_non_list_tool_list_skips_user():
+    out = _validate_acl_data({"users": {"alice": {"enabled_tools": "get_cml_labs"}}})
+    assert out["users"] == {}
+
+
+def test_non_string_entries_are_dropped_not_the_user():
+    out = _validate_acl_data(
+        {
+            "users": {
+                "alice": {"enabled_tools": ["get_cml_labs", 123, True]},
+                "bob": {"disabled_tools": ["delete_cml_lab", None]},
+            }
+        }
+    )
+    assert out["users"]["alice"]["enabled_tools"] == frozenset({"get_cml_labs"})
+    assert out["users"]["bob"]["disabled_tools"] == frozenset({"delete_cml_lab"})
+
+
+@pytest.mark.asyncio
+async def test_allow_list_with_non_string_entry_is_still_enforced(acl):
+    acl({"default_enabled": True, "users": {"alice": {"enabled_tools": ["get_cml_labs", 123]}}})
+    client = _MockClient("alice")
+    assert await CustomHttpRequestMiddleware.check_tool_enabled("get_cml_labs", client) is True
+    assert await CustomHttpRequestMiddleware.check_tool_enabled("delete_cml_lab", client) is False
+
+
+@pytest.mark.asyncio
+async def test_block_list_with_non_string_entry_is_still_enforced(acl):
+    acl({"default_enabled": True, "users": {"bob": {"disabled_tools": ["delete_cml_lab", "yes", 7]}}})
+    client = _MockClient("bob")
+    assert await CustomHttpRequestMiddleware.check_tool_enabled("delete_cml_lab", client) is False
+    assert await CustomHttpRequestMiddleware.check_tool_enabled("get_cml_labs", client) is True
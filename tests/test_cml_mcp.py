@@ -26,12 +26,14 @@ Usage:
   pytest -m live_only tests/test_cml_mcp.py
 """
 
+import json
 from pathlib import Path
 
 import pytest
 import yaml
 from fastmcp.client import Client
 from fastmcp.client.transports import FastMCPTransport
+from fastmcp.exceptions import ToolError
 from inline_snapshot import snapshot  # , outsource
 from mcp.types import TextContent
 
@@ -52,8 +54,10 @@ from cml_mcp.cml.simple_common.schemas.system_health import SystemHealth
 from cml_mcp.cml.simple_webserver.schemas.system import SystemInformation, SystemStats
 from cml_mcp.cml.simple_webserver.schemas.topologies import Topology
 from cml_mcp.cml.simple_webserver.schemas.users import UserResponse
+from cml_mcp.tools.model_helpers import validate_and_dump
+from cml_mcp.tools.pcap import _packets_adapter
 from cml_mcp.types import SimplifiedInterfaceResponse, SuperSimplifiedNodeDefinitionResponse
-from tests.conftest import COMMON_TEST_LAB_TITLE
+from tests.conftest import COMMON_TEST_LAB_TITLE, MockCMLClient
 
 
 def _to_model(obj, cls):
@@ -304,6 +308,35 @@ async def test_get_annotations_for_cml_lab(main_mcp_client: Client[FastMCPTransp
     assert found_types == annotation_types, f"Expected {annotation_types}, but found {found_types}"
 
 
+@pytest.mark.mock_only
+@pytest.mark.parametrize(
+    "bad_annotation, expected",
+    [
+        ({"id": "a0b1c2d3-0000-4000-8000-000000000001", "type": "triangle"}, "triangle"),
+        ({"id": "a0b1c2d3-0000-4000-8000-000000000002"}, "discriminator 'type'"),
+    ],
+    ids=["unknown-type", "missing-type"],
+)
+async def test_get_annotations_for_cml_lab_bad_type(main_mcp_client: Client[FastMCPTransport], monkeypatch, bad_annotation, expected):
+    """
+    Annotations with an unknown or missing "type" tag are rejected with an error naming the problem.
+    """
+    original_get = MockCMLClient.get
+
+    async def _get(self, endpoint, params=None, is_binary=False):
+        if endpoint.endswith("/annotations"):
+            return [bad_annotation]
+        return await original_get(self, endpoint, params=params, is_binary=is_binary)
+
+    monkeypatch.setattr(MockCMLClient, "get", _get)
+
+    with pytest.raises(ToolError, match=expected):
+        await main_mcp_client.call_tool(
+            name="get_annotations_for_cml_lab",
+            arguments={"lab_id": "a0b1c2d3-0000-4000-8000-0000000000ff"},
+        )
+
+
 @pytest.mark.mock_only
 async def test_packet_capture_operations(main_mcp_client: Client[FastMCPTransport]):
     """
@@ -382,6 +415,13 @@ async def test_packet_capture_operations(main_mcp_client: Client[FastMCPTranspor
     assert isinstance(packet_overview.data, list)
     assert len(packet_overview.data) > 0
 
+    # The tool validates the raw JSON body with validate_json; it must match the
+    # per-packet validate_python construction it replaced on the same fixture.
+    raw_packets = json.loads((Path(__file__).parent / "mocks" / "get_captured_packet_overview.json").read_text())
+    expected_packets = [PCAPItem(**packet).model_dump(exclude_unset=True) for packet in raw_packets]
+    assert validate_and_dump(_packets_adapter, json.dumps(raw_packets).encode("utf-8")) == expected_packets
+    assert validate_and_dump(_packets_adapter, raw_packets) == expected_packets
+
     # Verify packet structure
     found_icmp = False
     for item in packet_overview.data:
@@ -0,0 +1,60 @@
+# Copyright (c) 2025-2026  Cisco Systems, Inc.
+# All rights reserved.
+
+"""Unit tests for cml_mcp.tools.model_helpers.validate_and_dump (mock / no-live runs)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from cml_mcp.tools.model_helpers import validate_and_dump
+
+pytestmark = pytest.mark.mock_only
+
+
+class _Inner(BaseModel):
+    a: int
+    b: int = 2
+
+
+class _Item(BaseModel):
+    x: int
+    y: str = "default"
+    inner: _Inner | None = None
+
+
+_items_adapter = TypeAdapter(list[_Item])
+
+_RAW = [
+    {"x": 1},
+    {"x": 2, "y": "set"},
+    {"x": 3, "inner": {"a": 1}},
+    {"x": 4, "y": "default", "inner": {"a": 1, "b": 2}},
+]
+
+
+def _per_item(raw: list[dict]) -> list[dict]:
+    """The per-item construction validate_and_dump replaces."""
+    return [_Item(**item).model_dump(exclude_unset=True) for item in raw]
+
+
+def test_list_input_matches_per_item_dump():
+    assert validate_and_dump(_items_adapter, _RAW) == _per_item(_RAW)
+
+
+def test_bytes_input_matches_per_item_dump():
+    assert validate_and_dump(_items_adapter, json.dumps(_RAW).encode("utf-8")) == _per_item(_RAW)
+
+
+def test_empty_list():
+    assert validate_and_dump(_items_adapter, []) == []
+    assert validate_and_dump(_items_adapter, b"[]") == []
+
+
+@pytest.mark.parametrize("raw", [[{"y": "missing x"}], b'[{"y": "missing x"}]'])
+def test_invalid_input_raises(raw):
+    with pytest.raises(ValidationError):
+        validate_and_dump(_items_adapter, raw)